@@ -0,0 +1,84 @@
+import os
+import threading
+from functools import lru_cache, wraps
+
+import pandas as pd
+
+# Data files live next to this module, independent of the working directory:
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Numeric columns for BASE data:
+BASE_NUMERIC_COLS = ["skydives", "WS_skydives", "base_jumps", "WS_base_jumps", "base_seasons", "age"]
+
+
+############################################
+# Shared data access
+############################################
+# Every loader is cached, so each dataset is read and preprocessed only once
+# per process, and only when a page first asks for it.
+# The returned frames are shared between all pages: never modify them in place!
+
+def load_once(loader):
+    # Cache for loaders without arguments. Unlike lru_cache, the first call is
+    # locked (double-checked), so threads of one gthread worker that visit a
+    # page at the same time wait for a single load instead of each reading the CSV:
+    lock = threading.Lock()
+    result = []
+
+    @wraps(loader)
+    def wrapper():
+        if not result:
+            with lock:
+                if not result:
+                    result.append(loader())
+        return result[0]
+
+    return wrapper
+
+
+@load_once
+def get_base_df():
+    # Load BFL data:
+    base_df = pd.read_csv(os.path.join(DATA_DIR, "cleaned_BFL_data.csv"))
+
+    # Convert some columns:
+    base_df['date'] = pd.to_datetime(base_df['date'])
+    base_df['year'] = base_df['date'].dt.year
+    base_df['description'] = base_df['description'].fillna('')  # for distinguishing empty descr
+    return base_df
+
+
+@load_once
+def get_uspa_df():
+    # Load USPA data:
+    uspa_df = pd.read_csv(os.path.join(DATA_DIR, "uspa_data_done.csv"), delimiter=';', low_memory=False)
+
+    # Convert some columns:
+    uspa_df['report_date'] = pd.to_datetime(uspa_df['report_date'], errors='coerce')
+    uspa_df['technical_error_component'] = uspa_df['human_error'].apply(lambda x: x == 'No')
+    return uspa_df
+
+
+@load_once
+def get_base_exploded():
+    temp_df = get_base_df().copy(deep=True)  # copy df to not change original df
+
+    # Split the comma-separated values into lists:
+    temp_df["possible_factors"] = temp_df["possible_factors"].str.split(", ")
+
+    # Explode the list into individual rows:
+    return temp_df.explode("possible_factors")
+
+
+@load_once
+def get_factor_list():
+    # Tuple, so the cached value can't be changed by a caller:
+    return tuple(sorted(get_base_exploded()["possible_factors"].dropna().unique()))
+
+
+@lru_cache(maxsize=128)  # bounded, the factor comes from the client
+def get_reports(factor):
+    # All reports with a description for one possible factor, positionally indexed:
+    df_exploded = get_base_exploded()
+    data = df_exploded[(df_exploded["possible_factors"] == factor) & (df_exploded["description"] != '')]
+    return data.reset_index(drop=True)
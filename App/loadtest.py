@@ -0,0 +1,507 @@
+"""Load test for the Dash app.
+
+Simulates concurrent dashboard sessions by replaying the requests a browser
+sends: page load, page switches, dropdown changes and Next/Next/Previous
+browsing in the report viewer.
+
+Run from the App folder:
+    python loadtest.py --mode wsgi --users 8 --duration 30
+    python loadtest.py --mode gunicorn --configs 1x1,2x1,2x4 --users 16 --duration 60
+
+"wsgi" runs the Flask server in this process (no gunicorn needed),
+"gunicorn" starts a local gunicorn for every workers x threads configuration.
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+############################################
+# Dash request payloads
+############################################
+
+# Component ids of the page container (see dash/_pages.py):
+PAGES_OUTPUTS = [("_pages_content", "children"), ("_pages_store", "data")]
+
+USPA_OUTPUTS = [("uspa-bar-plot", "figure"), ("uspa-bar-dropdown", "style")]
+REPORT_OUTPUTS = [("current-index", "data"),
+                  ("prev-button", "disabled"),
+                  ("next-button", "disabled"),
+                  ("description", "children"),
+                  ("BFL-victim-name", "children")]
+
+USPA_CHARTS = ["bc", "lc", "pc"]
+USPA_BAR_COLS = ["fatal", "category"]
+BASE_COUNT_COLS = ["country", "location", "age"]
+BASE_NUMERIC_COLS = ["skydives", "WS_skydives", "base_jumps", "WS_base_jumps", "base_seasons", "age"]
+
+
+def update_payload(outputs, inputs, state=(), changed=None):
+    # Body of a _dash-update-component request.
+    # outputs: [(id, prop)], inputs/state: [(id, prop, value)],
+    # changed: id of the triggering input, None for an initial call.
+    if len(outputs) == 1:
+        output = "%s.%s" % outputs[0]
+        outputs_json = {"id": outputs[0][0], "property": outputs[0][1]}
+    else:  # multi output callback
+        output = ".." + "...".join("%s.%s" % o for o in outputs) + ".."
+        outputs_json = [{"id": i, "property": p} for i, p in outputs]
+
+    payload = {
+        "output": output,
+        "outputs": outputs_json,
+        "inputs": [{"id": i, "property": p, "value": v} for i, p, v in inputs],
+        "changedPropIds": [f"{i}.{p}" for i, p, _ in inputs if i == changed],
+    }
+    if state:
+        payload["state"] = [{"id": i, "property": p, "value": v} for i, p, v in state]
+    return payload
+
+
+def find_prop(tree, component_id, prop):
+    # Look up a prop of a component in a serialized layout:
+    if isinstance(tree, list):
+        for child in tree:
+            found = find_prop(child, component_id, prop)
+            if found is not None:
+                return found
+    elif isinstance(tree, dict):
+        props = tree.get("props", {})
+        if props.get("id") == component_id:
+            return props.get(prop)
+        return find_prop(props.get("children"), component_id, prop)
+    return None
+
+############################################
+# Connections
+############################################
+
+class WsgiConnection:
+    # Calls the Flask server in this process, one test client per user:
+    def __init__(self, server):
+        self.client = server.test_client()
+
+    def request(self, method, path, body=None):
+        response = self.client.open(path, method=method, json=body)
+        return response.status_code, response.get_data()
+
+    def close(self):
+        pass
+
+
+class HttpConnection:
+    # Keep-alive HTTP connection to a local server, like a browser tab:
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.conn = None
+
+    def request(self, method, path, body=None):
+        if self.conn is None:
+            self.conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+        headers = {}
+        data = None
+        if body is not None:
+            data = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        try:
+            self.conn.request(method, path, body=data, headers=headers)
+            response = self.conn.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self.close()  # reconnect with the next request
+            raise
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+############################################
+# Simulated user
+############################################
+
+class SessionAborted(Exception):
+    pass
+
+
+class User:
+    def __init__(self, connection, seed, deadline, think_time):
+        self.connection = connection
+        self.rng = random.Random(seed)
+        self.deadline = deadline
+        self.think_time = think_time
+        self.samples = []  # (label, latency in s, ok)
+
+    def _timed(self, label, method, path, body=None):
+        if time.perf_counter() >= self.deadline:
+            raise SessionAborted()
+
+        start = time.perf_counter()
+        try:
+            status, data = self.connection.request(method, path, body)
+            ok = status in (200, 204)  # 204: PreventUpdate, no update
+        except (OSError, http.client.HTTPException):
+            data, ok = b"", False
+        self.samples.append((label, time.perf_counter() - start, ok))
+
+        if self.think_time:
+            time.sleep(self.rng.uniform(0, 2 * self.think_time))
+        return data if ok else None
+
+    def get(self, label, path):
+        return self._timed(label, "GET", path)
+
+    def update(self, label, payload):
+        data = self._timed(label, "POST", "/_dash-update-component", payload)
+        if not data:  # error or 204 (no update)
+            return {}
+        return json.loads(data).get("response", {})
+
+    def visit(self, path, first_load=False):
+        # Routing callback, returns the page layout.
+        # /_dash-layout only holds an empty page container: on first load the
+        # dcc.Location sets its pathname when mounted, which fires the routing
+        # callback like a page switch. It gets its own label, so the switch
+        # latencies aren't mixed with it.
+        label = "page load" if first_load else "page switch"
+        response = self.update(f"{label} {path}", update_payload(
+            PAGES_OUTPUTS,
+            [("_pages_location", "pathname", path), ("_pages_location", "search", "")],
+            changed="_pages_location"))
+        return response.get("_pages_content", {}).get("children")
+
+    ############################################
+    # Pages
+    ############################################
+
+    def browse_uspa(self):
+        chart, col = "bc", "category"
+        for step in range(4):
+            changed = None  # initial call when the page is loaded
+            if step:
+                if self.rng.random() < 0.5:
+                    chart, changed = self.rng.choice(USPA_CHARTS), "uspa-chart-dropdown"
+                else:
+                    col, changed = self.rng.choice(USPA_BAR_COLS), "uspa-bar-dropdown"
+            self.update("uspa chart", update_payload(
+                USPA_OUTPUTS,
+                [("uspa-bar-dropdown", "value", col), ("uspa-chart-dropdown", "value", chart)],
+                changed=changed))
+
+    def browse_bfl_charts(self):
+        # Initial calls of all charts when the page is loaded:
+        self.update("bfl count", update_payload(
+            [("base-count-plot", "figure")], [("base-count-dropdown", "value", "age")]))
+        self.update("bfl histogram", update_payload(
+            [("base-hist-plot", "figure")], [("base-hist-dropdown", "value", "base_jumps")]))
+        self.update("bfl scatter", update_payload(
+            [("base-scatter-plot", "figure")], [("base-scatter-checklist", "value", ["base_jumps", "base_seasons"])]))
+
+        # Dropdown changes:
+        for _ in range(3):
+            choice = self.rng.random()
+            if choice < 0.33:
+                self.update("bfl count", update_payload(
+                    [("base-count-plot", "figure")],
+                    [("base-count-dropdown", "value", self.rng.choice(BASE_COUNT_COLS))],
+                    changed="base-count-dropdown"))
+            elif choice < 0.66:
+                self.update("bfl histogram", update_payload(
+                    [("base-hist-plot", "figure")],
+                    [("base-hist-dropdown", "value", self.rng.choice(BASE_NUMERIC_COLS))],
+                    changed="base-hist-dropdown"))
+            else:
+                self.update("bfl scatter", update_payload(
+                    [("base-scatter-plot", "figure")],
+                    [("base-scatter-checklist", "value", self.rng.sample(BASE_NUMERIC_COLS, 2))],
+                    changed="base-scatter-checklist"))
+
+    def browse_reports(self, layout):
+        factors = [option["value"] for option in find_prop(layout, "factor-dropdown", "options") or []]
+        factor = find_prop(layout, "factor-dropdown", "value")
+        index, prev_clicks, next_clicks = 0, None, None
+
+        def report(changed):
+            response = self.update("report " + (changed or "initial"), update_payload(
+                REPORT_OUTPUTS,
+                [("factor-dropdown", "value", factor),
+                 ("prev-button", "n_clicks", prev_clicks),
+                 ("next-button", "n_clicks", next_clicks)],
+                state=[("current-index", "data", index)],
+                changed=changed))
+            return response.get("current-index", {}).get("data", index)
+
+        index = report(None)
+        for _ in range(2):
+            if factors:  # pick another factor, then Next, Next, Previous
+                factor = self.rng.choice(factors)
+                index = report("factor-dropdown")
+            next_clicks = (next_clicks or 0) + 1
+            index = report("next-button")
+            next_clicks += 1
+            index = report("next-button")
+            prev_clicks = (prev_clicks or 0) + 1
+            index = report("prev-button")
+
+    def run_session(self):
+        # Visit the pages in random order, the browser opens the first one:
+        pages = ["/", "/bfl-charts", "/reports"]
+        self.rng.shuffle(pages)
+
+        # Initial page load of the browser:
+        self.get("index", pages[0])
+        self.get("layout", "/_dash-layout")
+        self.get("dependencies", "/_dash-dependencies")
+
+        for step, path in enumerate(pages):
+            layout = self.visit(path, first_load=step == 0)
+            if path == "/":
+                self.browse_uspa()
+            elif path == "/bfl-charts":
+                self.browse_bfl_charts()
+            else:
+                self.browse_reports(layout)
+
+    def run(self):
+        try:
+            while True:
+                self.run_session()
+        except SessionAborted:
+            pass
+        finally:
+            self.connection.close()
+
+############################################
+# Memory
+############################################
+
+def rss_mb(pid):
+    # Resident memory of a process (Linux only, None elsewhere):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def child_pids(pid):
+    children = []
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return children
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The process name may contain spaces, fields after it are fixed:
+        if int(stat.rsplit(")", 1)[1].split()[1]) == pid:
+            children.append(int(entry))
+    return children
+
+
+class MemoryMonitor(threading.Thread):
+    # Samples the peak RSS of every worker while the test is running:
+    def __init__(self, get_pids, interval=0.5):
+        super().__init__(daemon=True)
+        self.get_pids = get_pids
+        self.interval = interval
+        self.peak = {}
+        self.stopped = threading.Event()
+
+    def sample(self):
+        for pid in self.get_pids():
+            rss = rss_mb(pid)
+            if rss is not None:
+                self.peak[pid] = max(rss, self.peak.get(pid, 0))
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.sample()
+
+############################################
+# Servers
+############################################
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_gunicorn(workers, threads, port, preload):
+    cmd = [sys.executable, "-m", "gunicorn", "app:server",
+           "--workers", str(workers),
+           "--threads", str(threads),
+           "--bind", f"127.0.0.1:{port}",
+           "--log-level", "warning"]
+    if preload:
+        cmd.append("--preload")
+    process = subprocess.Popen(cmd, cwd=APP_DIR)
+
+    # Wait until the server answers:
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with code {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("gunicorn did not start within 60 s")
+
+############################################
+# Runner
+############################################
+
+def percentile(sorted_values, p):
+    # Nearest-rank percentile:
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_users(make_connection, users, duration, think_time, seed):
+    deadline = time.perf_counter() + duration
+    clients = [User(make_connection(), seed + i, deadline, think_time) for i in range(users)]
+    threads = [threading.Thread(target=client.run) for client in clients]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return [sample for client in clients for sample in client.samples], elapsed
+
+
+def run_config(args, workers, threads):
+    if args.mode == "wsgi":
+        if APP_DIR not in sys.path:
+            sys.path.insert(0, APP_DIR)
+        os.chdir(APP_DIR)
+        import app  # data is loaded lazily on the first page visit
+
+        monitor = MemoryMonitor(lambda: [os.getpid()])
+        make_connection = lambda: WsgiConnection(app.server)
+        process = None
+    else:
+        port = free_port()
+        process = start_gunicorn(workers, threads, port, args.preload)
+        monitor = MemoryMonitor(lambda: child_pids(process.pid))
+        make_connection = lambda: HttpConnection("127.0.0.1", port)
+
+    try:
+        monitor.start()
+        if args.warmup:
+            run_users(make_connection, args.users, args.warmup, args.think_time, args.seed)
+        samples, elapsed = run_users(make_connection, args.users, args.duration, args.think_time, args.seed)
+    finally:
+        monitor.stop()
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    return samples, elapsed, sorted(monitor.peak.values())
+
+
+def summarize(samples, elapsed):
+    latencies = sorted(latency for _, latency, _ in samples)
+    errors = sum(1 for _, _, ok in samples if not ok)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "rps": len(samples) / elapsed if elapsed else 0,
+        "p50": percentile(latencies, 50) * 1000,
+        "p95": percentile(latencies, 95) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+    }
+
+
+def print_report(results, by_request):
+    header = f"{'workers':>7} {'threads':>7} {'requests':>8} {'errors':>6} {'req/s':>8} " \
+             f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  RSS per worker (MB)"
+    print(header)
+    print("-" * len(header))
+    for workers, threads, samples, elapsed, memory in results:
+        s = summarize(samples, elapsed)
+        rss = ", ".join(f"{m:.0f}" for m in memory) or "n/a"
+        print(f"{workers:>7} {threads:>7} {s['requests']:>8} {s['errors']:>6} {s['rps']:>8.1f} "
+              f"{s['p50']:>8.1f} {s['p95']:>8.1f} {s['p99']:>8.1f}  {rss}")
+
+        if by_request:
+            labels = sorted({label for label, _, _ in samples})
+            for label in labels:
+                r = summarize([sample for sample in samples if sample[0] == label], elapsed)
+                print(f"{'':>16}{label:<28} n={r['requests']:<6} "
+                      f"p50={r['p50']:.1f} p95={r['p95']:.1f} p99={r['p99']:.1f}")
+
+
+def parse_configs(value):
+    # "1x1,2x4" -> [(1, 1), (2, 4)]
+    configs = []
+    for config in value.split(","):
+        workers, threads = config.lower().split("x")
+        configs.append((int(workers), int(threads)))
+    return configs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test with simulated dashboard sessions.")
+    parser.add_argument("--mode", choices=["wsgi", "gunicorn"], default="wsgi",
+                        help="wsgi: Flask server in this process, gunicorn: local gunicorn per config")
+    parser.add_argument("--configs", type=parse_configs, default=[(1, 1)],
+                        help="gunicorn workers x threads, e.g. 1x1,2x1,2x4 (default: 1x1)")
+    parser.add_argument("--users", type=int, default=8, help="concurrent sessions (default: 8)")
+    parser.add_argument("--duration", type=float, default=30, help="seconds per config (default: 30)")
+    parser.add_argument("--warmup", type=float, default=5,
+                        help="seconds of unmeasured load before each run, 0 to disable (default: 5)")
+    parser.add_argument("--think-time", type=float, default=0,
+                        help="mean pause between requests of a user in seconds (default: 0)")
+    parser.add_argument("--preload", action="store_true", help="start gunicorn with --preload")
+    parser.add_argument("--by-request", action="store_true", help="also print latencies per request type")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.mode == "wsgi":
+        # Only one process, the users share the in-process server:
+        args.configs = [(1, args.users)]
+
+    results = []
+    for workers, threads in args.configs:
+        print(f"Running {workers} worker(s) x {threads} thread(s) with {args.users} users "
+              f"for {args.duration:g} s ...", file=sys.stderr)
+        samples, elapsed, memory = run_config(args, workers, threads)
+        results.append((workers, threads, samples, elapsed, memory))
+
+    print_report(results, args.by_request)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+from functools import lru_cache
+
+import dash
+from dash import dcc, html, Input, Output, callback
+import pandas as pd
+import plotly.express as px
+from scipy.stats import pearsonr
+import statsmodels.api as sm
+
+from data_access import BASE_NUMERIC_COLS, get_base_df
+
+dash.register_page(__name__, path="/bfl-charts", name="BASE Fatalities", order=1)
+
+
+############################################
+# Static figures (built on first visit)
+############################################
+
+@lru_cache(maxsize=None)
+def get_year_line():
+    grouped_year = get_base_df().groupby(by='year').size()
+
+    return px.line(grouped_year, title="Line Plot for Number of Base Fatalities per Year").update_layout(
+                                template='plotly_dark',
+                                plot_bgcolor='rgba(0, 0, 0, 0)',
+                                paper_bgcolor='rgba(0, 0, 0, 0)',
+                            )
+
+
+@lru_cache(maxsize=None)
+def get_stacked_bar():
+    base_df = get_base_df()
+
+    # Find the top 5 most frequent locations:
+    top_locations = base_df['location'].value_counts().nlargest(5).index
+
+    # Replace locations not in the top 5 with "Other" (on a copy, base_df is shared):
+    filtered_df = base_df[['cause_of_death']].copy()
+    filtered_df['filtered_location'] = base_df['location'].apply(lambda x: x if x in top_locations else 'Other')
+
+    # Group data by cause_of_death and filtered_location:
+    grouped_data = filtered_df.groupby(['cause_of_death', 'filtered_location']).size().reset_index(name='number_of_fatal_accidents')
+
+    # Sort the DataFrame by the total number of fatal accidents:
+    sorted_data = grouped_data.groupby('cause_of_death')['number_of_fatal_accidents'].sum().sort_values(ascending=False)
+
+    # Use the sorted order to reindex your DataFrame:
+    grouped_data['cause_of_death'] = pd.Categorical(
+        grouped_data['cause_of_death'],
+        categories=sorted_data.index,
+        ordered=True
+    )
+
+    # Pivot the data for stacked bar plotting:
+    pivot_data = grouped_data.pivot(index='cause_of_death', columns='filtered_location', values='number_of_fatal_accidents')
+
+    return px.bar(pivot_data, title="Stacked Bar Chart of Causes of Death for Top Countries", height=800).update_layout(
+                                template='plotly_dark',
+                                plot_bgcolor='rgba(0, 0, 0, 0)',
+                                paper_bgcolor='rgba(0, 0, 0, 0)',
+                            )
+
+############################################
+# Layout
+############################################
+
+def layout():
+    return html.Div([
+        html.H2("BASE Fatality Visualizations", style={"margin": "10px"}),
+
+        # Fatalities per year:
+        dcc.Graph(figure=get_year_line()),
+
+        # Fatalities per country/location/age:
+        dcc.Dropdown(
+            id="base-count-dropdown",
+            options=[
+                {"label": "Per Country", "value": "country"},
+                {"label": "Per Location", "value": "location"},
+                {"label": "Per Age", "value": "age"}
+            ],
+            value="age",  # default selection
+            style={"width": "50%", "margin": "10px"}
+        ),
+        dcc.Graph(id="base-count-plot"),
+
+        # Causes of death for the top locations:
+        dcc.Loading(id="loading-stacked-bar",
+                    type="circle",
+                    children=dcc.Graph(figure=get_stacked_bar())
+                    ),
+
+        html.Hr(),
+
+        # Histogram Section:
+        html.H3("Histogram", style={"textAlign": "center"}),
+        dcc.Dropdown(
+            id="base-hist-dropdown",
+            options=[{"label": col, "value": col} for col in BASE_NUMERIC_COLS],
+            value="base_jumps",
+            multi=False,
+            style={"width": "50%", "margin": "10px"}
+        ),
+        dcc.Graph(id="base-hist-plot"),
+
+        # Results:
+        html.P("All the numeric data is right-skewed (median < mean). "
+        "This may imply that BASE fatalities occur more often with inexperienced jumpers. "
+        "However, this is based only on the fatality numbers, successful jumps are not accounted for!"),
+
+        html.Hr(),
+
+        # Scatter Section:
+        html.H3("Scatter with Regression"),
+        dcc.Checklist(
+            id="base-scatter-checklist",
+            options=[{"label": col, "value": col} for col in BASE_NUMERIC_COLS],
+            value=["base_jumps", "base_seasons"],
+            inline=True,
+            style={"margin": "20px"}
+        ),
+        dcc.Graph(id="base-scatter-plot")
+    ])
+
+############################################
+# Callbacks for BFL
+############################################
+
+# Callback for the number of accidents per country/location/age:
+@callback(
+    Output("base-count-plot", "figure"),
+    Input("base-count-dropdown", "value")
+)
+def update_base_count(selected_column):
+    counts = get_base_df().groupby(by=selected_column).size().sort_values(ascending=False)
+    return px.bar(counts, height=800, title=f"Bar Plot for Number of Accidents per {selected_column}").update_layout(
+                                template='plotly_dark',
+                                plot_bgcolor='rgba(0, 0, 0, 0)',
+                                paper_bgcolor='rgba(0, 0, 0, 0)'
+                            )
+
+# Callback for BASE Histogram:
+@callback(
+    Output("base-hist-plot", "figure"),
+    Input("base-hist-dropdown", "value")
+)
+def update_base_histogram(selected_col):
+    data = get_base_df()[selected_col].dropna()
+    mean_val = data.mean()
+    median_val = data.median()
+
+    fig = px.histogram(
+        data_frame=pd.DataFrame({selected_col: data}),
+        x=selected_col,
+        nbins=30,
+        title=f"Histogram of {selected_col} (n={len(data)})",
+        labels={selected_col: selected_col}
+    )
+
+    fig.add_vline(x=mean_val, line_dash="dash", line_color="red", annotation_text=f"Mean={mean_val:.1f}")
+    fig.add_vline(x=median_val, line_dash="dash", line_color="green", annotation_text=f"Median={median_val:.1f}")
+
+    fig.update_layout(
+        template='plotly_dark',
+        plot_bgcolor='rgba(0, 0, 0, 0)',
+        paper_bgcolor='rgba(0, 0, 0, 0)',
+        bargap=0.1,
+        showlegend=False,
+        annotations=[
+            dict(x=mean_val, y=0.9, xref="x", yref="paper", text=f"Mean={mean_val:.1f}", showarrow=False),
+            dict(x=median_val, y=0.8, xref="x", yref="paper", text=f"Median={median_val:.1f}", showarrow=False)
+        ]
+    )
+
+    return fig
+
+# Callback for BASE Scatter Plot:
+@callback(
+    Output("base-scatter-plot", "figure"),
+    Input("base-scatter-checklist", "value")
+)
+def update_base_scatter(selected_cols):
+    if len(selected_cols) != 2:  # more or less than 2 ticked
+        fig = px.scatter(title="Please select exactly 2 attributes")
+        fig.update_layout(template='plotly_dark',
+                          plot_bgcolor='rgba(0, 0, 0, 0)',
+                          paper_bgcolor='rgba(0, 0, 0, 0)',)
+        return fig
+
+    base_df = get_base_df()
+    x_col, y_col = selected_cols
+    df_clean = base_df[[x_col, y_col]].dropna()  # necessary for p-value and correlation
+    n_rows = df_clean.shape[0]
+
+    if n_rows < 10:  # not enough data
+        return px.scatter(title=f"No data available for {x_col} vs. {y_col}")
+
+
+    corr, p_value = pearsonr(df_clean[x_col], df_clean[y_col])
+    X = sm.add_constant(df_clean[x_col])
+    model = sm.OLS(df_clean[y_col], X).fit()
+    slope = model.params.iloc[1]
+    std_err = model.bse.iloc[1]
+    conf_int = model.conf_int().loc[x_col].values
+
+    fig = px.scatter(
+        df_clean,
+        x=x_col,
+        y=y_col,
+        title=f"{x_col} vs. {y_col}",
+        trendline="ols",
+        trendline_color_override="red"
+    )
+
+    fig.update_layout(template='plotly_dark',
+                      plot_bgcolor='rgba(0, 0, 0, 0)',
+                      paper_bgcolor='rgba(0, 0, 0, 0)')
+
+    stats_text = (f"n={n_rows}/{len(base_df)},\n"
+                  f"Corr={corr:.3f}, P={p_value:.3f},\n"
+                  f"Slope={slope:.3f}, SE={std_err:.3f},\n"
+                  f"95% CI=[{conf_int[0]:.3f}, {conf_int[1]:.3f}]")
+
+    fig.add_annotation(
+        xref="paper", yref="paper",
+        x=0.45, y=1.10,
+        text=stats_text,
+        showarrow=False,
+        bgcolor="rgba(0, 0, 0, 0)",
+        bordercolor="rgba(0, 0, 0, 0)",
+        borderwidth=1
+    )
+
+    return fig
@@ -0,0 +1,115 @@
+import dash
+from dash import dcc, html, Input, Output, State, callback, callback_context
+
+from data_access import get_factor_list, get_reports
+
+dash.register_page(__name__, path="/reports", name="Report Browser", order=2)
+
+
+############################################
+# Layout
+############################################
+
+def layout():
+    return html.Div([
+        # Header for word cloud:
+        html.H1("What Factors Are Most Prominent in Base Fatalities?", style={"textAlign": "center"}),
+
+        # Wordcloud image:
+        html.Div([
+            html.Img(src="/assets/wordcloud.png", style={"width": "60%", "height": "auto", "align": "center"})
+        ], style={'textAlign': 'center'}
+        ),
+
+        # Disclaimer text:
+        html.Div(children=[
+            html.H2("Disclaimer"),
+            html.H3("These are incident descriptions from the Base Fatality List (BFL)."
+            " Some contain detailed reports of what happened and led to the accident, some contain emotional words from family or friends."
+            " We shall learn from their mistakes to prevent more accidents in the future.")
+        ], style={"textAlign": "center", "white-space": "pre-wrap"}
+        ),
+
+        # Explanation for dropdown:
+        html.H4("Choose a possible factor to browse reports for:", style={"textAlign": "left"}),
+
+        # Factor selector:
+        dcc.Dropdown(
+            id="factor-dropdown",
+            options=[{"label": factor, "value": factor} for factor in get_factor_list()],
+            value="Canopy Entanglement",  # default selected value
+            style={"width": "50%"},
+            className="large-dropdown"  # custom class for styling
+        ),
+
+        # Victim's name:
+        html.H3(id="BFL-victim-name", style={"fontSize": "18px",
+                                        "padding": "20px",
+                                        "textAlign": "center"
+                                        }),
+
+
+        # Paragraph for incident description:
+        html.Div(id="description", style={"height": "200px",
+                                          "overflow-y": "scroll",
+                                          "border": "1px solid black",
+                                          "padding": "10px",
+                                          "margin": "10px",
+                                          "whiteSpace": "pre-wrap"}  # convert \n to actual line break
+        ),
+
+        # Buttons to get next and previous incident description/report:
+        html.Button("Previous", id="prev-button", disabled=True),  # initially disabled
+        html.Button("Next", id="next-button"),
+
+        # Hidden component to store the current index:
+        dcc.Store(id="current-index", data=0)
+    ])
+
+############################################
+# Callbacks for the report browser
+############################################
+
+# Combined callback for BFL incident reports and names:
+@callback(
+    [Output("current-index", "data"),
+     Output("prev-button", "disabled"),
+     Output("next-button", "disabled"),
+     Output("description", "children"),
+     Output("BFL-victim-name", "children")],
+    [Input("factor-dropdown", "value"),
+     Input("prev-button", "n_clicks"),
+     Input("next-button", "n_clicks")],
+    State("current-index", "data")
+)
+def reset_index_on_factor_change(selected_factor, prev_clicks, next_clicks, current_index):
+    # Reports for the selected factor (cached per factor):
+    data = get_reports(selected_factor)
+
+    # Get the triggered input ("next", "previous" or "dropdown"):
+    triggered_id = callback_context.triggered[0]["prop_id"].split(".")[0]
+
+    # Reset index to 0 if the dropdown changes:
+    if triggered_id == "factor-dropdown":
+        current_index = 0
+
+    # Navigate with buttons:
+    elif triggered_id == "prev-button" and current_index > 0:
+        current_index -= 1
+    elif triggered_id == "next-button" and current_index < len(data) - 1:
+        current_index += 1
+
+    if data.empty:  # e.g. dropdown cleared
+        return 0, True, True, "No incidents available.", ""
+
+    # Get the current description:
+    description = data.iloc[current_index]['description']
+
+    name = "In Memory of "
+    name += data.iloc[current_index]['name']
+
+    # Enable/disable buttons based on boundaries:
+    prev_disabled = current_index == 0
+    next_disabled = current_index == len(data) - 1
+
+    return current_index, prev_disabled, next_disabled, description, name
@@ -0,0 +1,105 @@
+import dash
+from dash import dcc, html, Input, Output, callback
+import plotly.express as px
+
+from data_access import get_uspa_df
+
+dash.register_page(__name__, path="/", name="USPA Data", order=0)
+
+
+############################################
+# Layout
+############################################
+
+# Built on each visit, the USPA data itself is only loaded by the callback:
+def layout():
+    return html.Div([
+        html.H2("USPA Data Visualizations", style={"margin": "10px"}),
+        html.P("Question 6"),
+
+        dcc.Dropdown(
+            id="uspa-chart-dropdown",
+            options=[{"label": "Pie Chart", "value": "pc"},
+                     {"label": "Bar Chart", "value": "bc"},
+                     {"label": "Line Chart", "value": "lc"}],
+            value="bc",
+            multi=False,
+            style={"width": "50%", "margin": "10px"}
+        ),
+
+        dcc.Dropdown(
+            id="uspa-bar-dropdown",
+            options=[{"label": "by fatal or not", "value": "fatal"},
+                     {"label": "by category", "value": "category"}],
+            value="category",
+            multi=False,
+            style={"width": "50%", "margin": "10px", "display": "block"}
+        ),
+        dcc.Graph(id="uspa-bar-plot")
+    ])
+
+############################################
+# Callbacks for USPA
+############################################
+
+# Callback for USPA Bar Plot:
+@callback(
+    [Output("uspa-bar-plot", "figure"),
+     Output(component_id='uspa-bar-dropdown', component_property='style')],
+    [Input("uspa-bar-dropdown", "value"),
+     Input("uspa-chart-dropdown", "value")]
+)
+def update_uspa_bar(selected_col, selected_chart):
+    uspa_df = get_uspa_df()
+
+    if selected_chart == "bc":  # bar chart
+        visible = {"width": "50%", "margin": "10px", 'display': 'block'}
+        category_counts = uspa_df.groupby([selected_col, 'technical_error_component']).size().reset_index(name='Count')
+        fig = px.bar(
+        category_counts,
+        x='Count',
+        y=selected_col,
+        color='technical_error_component',
+        title=f'Skydiving Accidents by {selected_col}',
+        labels={'technical_error_component': 'Technical Error Involved', selected_col: 'Accident Category'},
+        barmode='stack',
+        orientation='h'
+        )
+        fig.update_layout(yaxis={'categoryorder':'total ascending'})
+
+    elif selected_chart == "lc":  # line chart
+        visible = {'display': 'none'}
+        df_time_series = uspa_df.groupby(['report_date', 'technical_error_component']).size().reset_index(name='Count')
+
+        fig = px.line(
+            df_time_series,
+            x='report_date',
+            y='Count',
+            color='technical_error_component',
+            title='Trend of Skydiving Accidents Over Time',
+            labels={'technical_error_component': 'Technical Error Involved', 'report_date': 'Date', 'Count': 'Number of Accidents'},
+            markers=True
+        )
+
+    elif selected_chart == "pc":  # pie chart
+        # Count occurrences of technical vs non-technical errors:
+        technical_error_counts = uspa_df['technical_error_component'].value_counts().reset_index()
+        technical_error_counts.columns = ['Technical Error Contribution', 'Count']
+        technical_error_counts['Technical Error Contribution'] = technical_error_counts['Technical Error Contribution'].map({True: 'Yes', False: 'No'})
+        visible = {'display': 'none'}
+        fig = px.pie(
+            technical_error_counts,
+            names='Technical Error Contribution',
+            values='Count',
+            title='Skydiving Accidents: Technical Error Contribution',
+            hole=0.4,
+            color='Technical Error Contribution',
+            color_discrete_map={'Yes': 'red', 'No': 'blue'}
+        )
+        fig.update_traces(textinfo='percent+label')
+
+    fig.update_layout(template='plotly_dark',
+                      plot_bgcolor='rgba(0, 0, 0, 0)',
+                      paper_bgcolor='rgba(0, 0, 0, 0)')
+
+    return fig, visible